@@ -3,6 +3,11 @@ Base class for all data sources in the intelligence feeds module.
 Provides common interface and ethical data handling guidelines.
 """
 
+import hashlib
+import time
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -14,6 +19,18 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _anonymize_user_id(user_id: str) -> str:
+    """Stable anonymized digest of a user identifier.
+
+    Cached so repeated anonymization of the same id across fetches costs
+    one hash per unique user instead of one per call. BLAKE2s sized to the
+    16-hex output we keep: faster than SHA-256 on short ids and no digest
+    bits are computed only to be truncated away.
+    """
+    return hashlib.blake2s(str(user_id).encode(), digest_size=8).hexdigest()
+
+
 class DataSourceBase(ABC):
     """
     Abstract base class for all data sources.
@@ -22,10 +39,14 @@ class DataSourceBase(ABC):
     standardized interface for cycle-aware data ingestion.
     """
     
+    # Consent lookups are cached per user for this long (seconds)
+    CONSENT_CACHE_TTL = 3600
+    CONSENT_CACHE_MAX = 1024
+
     def __init__(self, name: str, ethical_compliance: Dict[str, Any] = None):
         """
         Initialize data source with ethical compliance metadata.
-        
+
         Args:
             name: Human-readable name of the data source
             ethical_compliance: Dict with consent, privacy, and audit info
@@ -33,7 +54,8 @@ class DataSourceBase(ABC):
         self.name = name
         self.ethical_compliance = ethical_compliance or {}
         self.created_at = datetime.now()
-        
+        self._consent_cache = {}
+
         # Validate ethical compliance requirements
         self._validate_ethical_compliance()
         
@@ -76,6 +98,76 @@ class DataSourceBase(ABC):
         """
         pass
     
+    def _check_consent(self, player_id: str) -> bool:
+        """
+        Authoritative consent lookup for a single player.
+
+        Subclasses backed by a consent database should override this;
+        the default trusts the source-level compliance declaration.
+        """
+        return bool(self.ethical_compliance.get('consent_verified', False))
+
+    def validate_consent(self, player_id: str) -> bool:
+        """
+        Check consent for a player, caching results with a TTL.
+
+        Repeated ingests within the TTL window share one authoritative
+        lookup, but the audit trail is written on every call so the
+        compliance log stays complete even when the lookup is elided.
+        """
+        now = time.time()
+        cached = self._consent_cache.get(player_id)
+        if cached is not None and now - cached[1] < self.CONSENT_CACHE_TTL:
+            result = cached[0]
+        else:
+            result = self._check_consent(player_id)
+            if len(self._consent_cache) >= self.CONSENT_CACHE_MAX:
+                self._consent_cache.clear()
+            self._consent_cache[player_id] = (result, now)
+
+        logger.info(f"Data Source: {self.name} | Action: consent_check | "
+                    f"Player: {_anonymize_user_id(player_id)} | Granted: {result}")
+        return result
+
+    def _check_consent_batch(self, player_ids: List[str]) -> Dict[str, bool]:
+        """
+        Authoritative consent lookup for many players at once.
+
+        Subclasses backed by a consent database should override this with
+        a single IN-filtered query; the default falls back to per-player
+        checks so overriding _check_consent alone keeps working.
+        """
+        return {pid: self._check_consent(pid) for pid in player_ids}
+
+    def prefetch_consents(self, player_ids: List[str]) -> set:
+        """
+        Warm the consent cache for a batch job and return the allowlist.
+
+        One batch lookup covers every player whose cached answer is missing
+        or stale, so an N-player ingest costs one authoritative round-trip
+        instead of one per player. The TTL still applies, so long-running
+        daemons pick up revocations within CONSENT_CACHE_TTL seconds.
+        """
+        now = time.time()
+        missing = []
+        for pid in player_ids:
+            cached = self._consent_cache.get(pid)
+            if cached is None or now - cached[1] >= self.CONSENT_CACHE_TTL:
+                missing.append(pid)
+
+        if missing:
+            results = self._check_consent_batch(missing)
+            if len(self._consent_cache) + len(results) > self.CONSENT_CACHE_MAX:
+                self._consent_cache.clear()
+            for pid, granted in results.items():
+                self._consent_cache[pid] = (granted, now)
+
+        allowlist = {pid for pid in player_ids
+                     if self._consent_cache.get(pid, (False, 0.0))[0]}
+        logger.info(f"Data Source: {self.name} | Action: consent_prefetch | "
+                    f"Players: {len(player_ids)} | Granted: {len(allowlist)}")
+        return allowlist
+
     def anonymize_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply additional anonymization to protect athlete privacy.
@@ -89,11 +181,23 @@ class DataSourceBase(ABC):
         # Remove any potential PII columns
         pii_columns = ['name', 'email', 'phone', 'address', 'ssn']
         df_clean = df.drop(columns=[col for col in pii_columns if col in df.columns])
-        
-        # Add ethical audit trail
-        df_clean['anonymized_at'] = datetime.now()
-        df_clean['data_source'] = self.name
-        
+
+        # Replace raw player identifiers with cached anonymized digests;
+        # factorize first so each distinct id is hashed once and the digests
+        # are broadcast back by integer codes rather than per-row map calls
+        if 'player_id' in df_clean.columns:
+            codes, uniques = pd.factorize(df_clean['player_id'])
+            digests = np.array([_anonymize_user_id(u) for u in uniques], dtype=object)
+            df_clean['player_id'] = digests[codes]
+
+        # Add ethical audit trail; scalar timestamp broadcasts as a native
+        # datetime64 column and the source name as int8 categorical codes,
+        # keeping both columnar-friendly for Parquet/Supabase writes
+        df_clean['anonymized_at'] = pd.Timestamp.now(tz='UTC')
+        df_clean['data_source'] = pd.Categorical.from_codes(
+            [0] * len(df_clean), categories=[self.name]
+        )
+
         return df_clean
     
     def log_access(self, action: str, player_count: int, date_range: tuple):
@@ -8,15 +8,123 @@ Privacy Notice: All data handling follows strict anonymization and
 consent-based practices. No personal identifiers are stored.
 """
 
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import time
+
+import httpx
+import numpy as np
 import pandas as pd
-import requests
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 import logging
 from .base import DataSourceBase
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    _loads = json.loads
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional accelerator for multi-year backfills
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# Terra reports flow either on the numeric 0-4 scale or as text labels.
+# Labels are resolved through categorical codes indexing a lookup table,
+# so the hot path is branchless NumPy indexing rather than per-row dict
+# lookups; the extra LUT slot catches unknown labels (code -1) as 0.
+FLOW_MAPPING = {'none': 0, 'spotting': 1, 'light': 2, 'medium': 3, 'heavy': 4}
+FLOW_CATS = list(FLOW_MAPPING)
+FLOW_LUT = np.array(list(FLOW_MAPPING.values()) + [0], dtype=np.int8)
+
+# Symptom severities likewise arrive as 0-3 numbers or text labels
+SEVERITY_MAP = {'none': 0, 'mild': 1, 'moderate': 2, 'severe': 3}
+SEVERITY_CATS = list(SEVERITY_MAP)
+SEVERITY_LUT = np.array(list(SEVERITY_MAP.values()) + [0], dtype=np.int8)
+
+
+# Explicit dtypes for the processed cycle frame; alignment otherwise leaves
+# inferred object/float64 columns that poison downstream merges
+CYCLE_SCHEMA = {
+    'cycle_day': 'float32',
+    'cycle_length': 'float32',
+    'ovulation_probability': 'float32',
+    'cervical_fluid': 'float32',
+    'basal_temp': 'float32',
+    'period_active': 'boolean',
+    'fertility_window': 'boolean',
+}
+
+
+def _lookup_labels(series: pd.Series, categories: List[str], lut: np.ndarray) -> np.ndarray:
+    """Map string labels to scores via categorical codes + LUT indexing."""
+    codes = pd.Categorical(series.str.lower(), categories=categories).codes
+    return lut[np.where(codes >= 0, codes, len(categories))]
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _clip_scores(a, upper):
+        """Parallel fill-and-clip of a score array into int8."""
+        out = np.empty(a.shape[0], dtype=np.int8)
+        for i in prange(a.shape[0]):
+            v = a[i]
+            if np.isnan(v) or v <= 0:
+                out[i] = 0
+            elif v > upper:
+                out[i] = upper
+            else:
+                out[i] = int(v)
+        return out
+else:
+    _clip_scores = None
+
+# Below this row count the pandas clip is cheaper than JIT dispatch
+_JIT_THRESHOLD = 10_000
+
+
+def _finalize_scores(series: pd.Series, upper: int):
+    """Fill NaNs, clip to [0, upper] and downcast to int8."""
+    if _clip_scores is not None and len(series) > _JIT_THRESHOLD:
+        return _clip_scores(series.to_numpy(dtype=np.float64), upper)
+    return series.fillna(0).clip(0, upper).astype('int8')
+
+# Shared connection-pool policy for every ClueDataSource instance: capped
+# below Terra's concurrent-connection limit, keep-alive on, transport-level
+# retries for transient failures
+_POOL_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+_TRANSPORT_RETRIES = 3
+
+
+def _normalize_symptom_severity(series: pd.Series) -> pd.Series:
+    """Normalize a symptom column to the 0-3 scale in one vectorized pass."""
+    str_mask = series.map(type).eq(str)
+    out = pd.to_numeric(series.where(~str_mask), errors='coerce')
+    if str_mask.any():
+        out[str_mask] = _lookup_labels(series[str_mask], SEVERITY_CATS, SEVERITY_LUT)
+    return _finalize_scores(out, 3)
+
+
+def _normalize_flow_intensity(series: pd.Series) -> pd.Series:
+    """Normalize a flow column to the 0-4 scale in one vectorized pass.
+
+    String labels go through a single Series.map against FLOW_MAPPING and
+    numeric values through to_numeric + clip; no per-row Python loop.
+    """
+    str_mask = series.map(type).eq(str)
+    out = pd.to_numeric(series.where(~str_mask), errors='coerce')
+    if str_mask.any():
+        out[str_mask] = _lookup_labels(series[str_mask], FLOW_CATS, FLOW_LUT)
+    return _finalize_scores(out, 4)
+
 
 class ClueDataSource(DataSourceBase):
     """
@@ -28,14 +136,21 @@ class ClueDataSource(DataSourceBase):
     - Symptom tracking (cramps, mood, etc.)
     - Ovulation predictions
     """
-    
-    def __init__(self, api_key: str, terra_endpoint: str = "https://api.tryterra.co/v2"):
+
+    # Immutable request pieces shared by every instance
+    _BASE_HEADERS = {'Content-Type': 'application/json'}
+
+
+    def __init__(self, api_key: str, terra_endpoint: str = "https://api.tryterra.co/v2",
+                 webhook_secret: Optional[str] = None):
         """
         Initialize Clue data source with Terra API credentials.
-        
+
         Args:
             api_key: Terra API key for accessing Clue data
             terra_endpoint: Base URL for Terra API
+            webhook_secret: Secret for verifying Terra webhook signatures
+                (falls back to the TERRA_WEBHOOK_SECRET environment variable)
         """
         ethical_compliance = {
             'consent_verified': True,
@@ -49,20 +164,53 @@ class ClueDataSource(DataSourceBase):
         
         self.api_key = api_key
         self.terra_endpoint = terra_endpoint
-        self.headers = {
-            'X-API-Key': api_key,
-            'Content-Type': 'application/json'
-        }
+        self.webhook_secret = webhook_secret or os.getenv('TERRA_WEBHOOK_SECRET', '')
+        self.headers = {**self._BASE_HEADERS, 'X-API-Key': api_key}
+
+        # On-disk response cache; TTL mirrors the declared data_retention
+        # so cached cycle data never outlives the ethical commitment
+        self.cache_dir = Path('.cache/terra')
+        retention_days = int(ethical_compliance['data_retention'].split('_')[0])
+        self.cache_ttl = retention_days * 86400
+
+    def _cache_path(self, endpoint: str, params: Dict) -> Path:
+        """Derive a stable cache file path for an endpoint + params pair."""
+        key = hashlib.sha256(
+            json.dumps([endpoint, params], sort_keys=True).encode()
+        ).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _cache_get(self, path: Path) -> Optional[Dict]:
+        """Return a cached payload if present and within TTL, else None."""
+        try:
+            if path.exists() and time.time() - path.stat().st_mtime < self.cache_ttl:
+                return _loads(path.read_bytes())
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _cache_put(self, path: Path, payload: Dict):
+        """Persist a payload to the on-disk cache (best effort)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(payload))
+        except OSError as e:
+            logger.warning(f"Could not write Terra cache entry: {str(e)}")
     
     def fetch_data(self, player_ids: List[str], date_range: tuple, **kwargs) -> pd.DataFrame:
         """
         Fetch Clue cycle data for specified players and date range.
-        
+
+        This is a batch entry point: pass the full league roster rather
+        than looping one player at a time, since all Terra calls for the
+        batch are issued concurrently over one pooled connection and the
+        per-player frames are concatenated once at the end.
+
         Args:
             player_ids: List of anonymized player Terra user IDs
             date_range: Tuple of (start_date, end_date)
             **kwargs: Additional parameters like data_types
-            
+
         Returns:
             DataFrame with cycle tracking data
         """
@@ -70,29 +218,41 @@ class ClueDataSource(DataSourceBase):
         
         start_date, end_date = date_range
         data_types = kwargs.get('data_types', ['menstruation', 'fertility'])
-        
+
+        # Fan out both Terra endpoints for every player concurrently; the
+        # workload is latency-bound, so wall time becomes ~max(RTT) not sum
+        responses = asyncio.run(
+            self._fetch_all_async(player_ids, start_date, end_date)
+        )
+
         all_data = []
-        
-        for player_id in player_ids:
+
+        for i, player_id in enumerate(player_ids):
             try:
-                # Fetch menstruation data
-                menstruation_data = self._fetch_menstruation_data(
-                    player_id, start_date, end_date
-                )
-                
-                # Fetch fertility/ovulation data  
-                fertility_data = self._fetch_fertility_data(
-                    player_id, start_date, end_date
-                )
-                
+                menstruation_data = responses[2 * i]
+                fertility_data = responses[2 * i + 1]
+
+                # Preserve per-player error isolation from gather(return_exceptions=True)
+                if isinstance(menstruation_data, Exception):
+                    logger.error(f"Error fetching data for player {player_id}: {str(menstruation_data)}")
+                    menstruation_data = {}
+                if isinstance(fertility_data, Exception):
+                    logger.error(f"Error fetching data for player {player_id}: {str(fertility_data)}")
+                    fertility_data = {}
+
+                # Players with nothing logged in the window skip frame
+                # construction and alignment entirely
+                if not menstruation_data and not fertility_data:
+                    continue
+
                 # Merge and process data for this player
                 player_data = self._process_player_data(
                     player_id, menstruation_data, fertility_data
                 )
-                
+
                 if not player_data.empty:
                     all_data.append(player_data)
-                    
+
             except Exception as e:
                 logger.error(f"Error fetching data for player {player_id}: {str(e)}")
                 continue
@@ -103,8 +263,102 @@ class ClueDataSource(DataSourceBase):
         combined_df = pd.concat(all_data, ignore_index=True)
         return self.anonymize_data(combined_df)
     
-    def _fetch_menstruation_data(self, player_id: str, start_date: datetime, 
-                                end_date: datetime) -> Dict:
+    def consume_webhook_payload(self, body: bytes, signature: str = '') -> pd.DataFrame:
+        """
+        Ingest a Terra webhook push without any HTTP polling.
+
+        Terra delivers cycle events by signed webhook; consuming them
+        directly turns O(users x days) REST polls into O(events) pushes.
+        The payload HMAC is verified against the webhook secret before
+        any data is touched.
+
+        Args:
+            body: Raw webhook request body
+            signature: Value of Terra's signature header
+
+        Returns:
+            DataFrame with the normalized cycle records from the event
+        """
+        # Fail closed: without a configured secret the signature cannot be
+        # verified, and unsigned health-data pushes must not be ingested
+        if not self.webhook_secret:
+            logger.error("Terra webhook rejected: no webhook secret "
+                         "configured, cannot verify signature")
+            return pd.DataFrame()
+        expected = hmac.new(
+            self.webhook_secret.encode(), body, hashlib.sha256
+        ).hexdigest()
+        if not hmac.compare_digest(expected, signature or ''):
+            logger.error("Terra webhook signature verification failed")
+            return pd.DataFrame()
+
+        try:
+            payload = _loads(body)
+        except ValueError as e:
+            logger.error(f"Malformed Terra webhook payload: {str(e)}")
+            return pd.DataFrame()
+
+        player_id = payload.get('user', {}).get('user_id', 'unknown')
+        data_type = payload.get('type', '')
+        self.log_access("consume_webhook", 1, (data_type,))
+
+        player_data = self._process_player_data(
+            player_id,
+            payload if data_type == 'menstruation' else {},
+            payload if data_type == 'fertility' else {}
+        )
+        if player_data.empty:
+            return player_data
+        return self.anonymize_data(player_data)
+
+    async def _afetch(self, client: httpx.AsyncClient, endpoint: str,
+                      params: Dict) -> Dict:
+        """Fetch a single Terra endpoint asynchronously, checking the disk cache first."""
+        cache_path = self._cache_path(endpoint, params)
+        cached = self._cache_get(cache_path)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await client.get(endpoint, params=params)
+            response.raise_for_status()
+            payload = _loads(response.content)
+        except httpx.HTTPError as e:
+            logger.error(f"Terra API request failed: {str(e)}")
+            return {}
+
+        if payload:
+            self._cache_put(cache_path, payload)
+        return payload
+
+    async def _fetch_all_async(self, player_ids: List[str], start_date: datetime,
+                               end_date: datetime) -> List[Dict]:
+        """Fetch menstruation and fertility data for all players concurrently.
+
+        All requests multiplex over a shared HTTP/2 client, so the TLS
+        handshake is paid once rather than twice per player. Returns a
+        flat list with menstruation and fertility payloads interleaved
+        per player, matching the order of `player_ids`.
+        """
+        transport = httpx.AsyncHTTPTransport(
+            http2=True, limits=_POOL_LIMITS, retries=_TRANSPORT_RETRIES
+        )
+
+        async with httpx.AsyncClient(
+            transport=transport, headers=self.headers, timeout=30.0
+        ) as client:
+            tasks = []
+            for player_id in player_ids:
+                tasks.append(self._fetch_menstruation_data(
+                    client, player_id, start_date, end_date
+                ))
+                tasks.append(self._fetch_fertility_data(
+                    client, player_id, start_date, end_date
+                ))
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_menstruation_data(self, client: httpx.AsyncClient, player_id: str,
+                                       start_date: datetime, end_date: datetime) -> Dict:
         """Fetch menstruation data from Terra API."""
         endpoint = f"{self.terra_endpoint}/menstruation"
         params = {
@@ -112,17 +366,10 @@ class ClueDataSource(DataSourceBase):
             'start_date': start_date.strftime('%Y-%m-%d'),
             'end_date': end_date.strftime('%Y-%m-%d')
         }
-        
-        try:
-            response = requests.get(endpoint, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            logger.error(f"Terra API request failed: {str(e)}")
-            return {}
-    
-    def _fetch_fertility_data(self, player_id: str, start_date: datetime,
-                             end_date: datetime) -> Dict:
+        return await self._afetch(client, endpoint, params)
+
+    async def _fetch_fertility_data(self, client: httpx.AsyncClient, player_id: str,
+                                    start_date: datetime, end_date: datetime) -> Dict:
         """Fetch fertility/ovulation data from Terra API."""
         endpoint = f"{self.terra_endpoint}/fertility"
         params = {
@@ -130,55 +377,100 @@ class ClueDataSource(DataSourceBase):
             'start_date': start_date.strftime('%Y-%m-%d'),
             'end_date': end_date.strftime('%Y-%m-%d')
         }
-        
-        try:
-            response = requests.get(endpoint, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            logger.error(f"Terra API request failed: {str(e)}")
-            return {}
+        return await self._afetch(client, endpoint, params)
     
     def _process_player_data(self, player_id: str, menstruation_data: Dict,
                            fertility_data: Dict) -> pd.DataFrame:
-        """Process raw Terra API data into standardized format."""
-        records = []
-        
+        """Process raw Terra API data into standardized format.
+
+        Uses pd.json_normalize to flatten the raw JSON lists in pandas'
+        C path rather than building one Python dict per record.
+        """
+        frames = []
+
         # Process menstruation periods
-        for period in menstruation_data.get('data', {}).get('periods', []):
-            record = {
-                'player_id': player_id,
-                'date': period.get('start_time', '').split('T')[0],
-                'cycle_day': period.get('cycle_day'),
-                'flow_intensity': period.get('flow', 0),  # 0-4 scale
-                'period_active': True,
-                'cycle_length': period.get('cycle_length_days'),
-                'symptoms_cramps': period.get('symptoms', {}).get('cramps', 0),
-                'symptoms_mood': period.get('symptoms', {}).get('mood_change', 0),
-                'data_type': 'menstruation'
-            }
-            records.append(record)
-        
-        # Process fertility/ovulation data  
-        for fertility in fertility_data.get('data', {}).get('fertility_windows', []):
-            record = {
-                'player_id': player_id,
-                'date': fertility.get('date', '').split('T')[0],
-                'ovulation_probability': fertility.get('ovulation_probability', 0),
-                'fertility_window': fertility.get('fertile', False),
-                'cervical_fluid': fertility.get('cervical_fluid_score', 0),
-                'basal_temp': fertility.get('temperature', None),
-                'data_type': 'fertility'
-            }
-            records.append(record)
-        
-        if not records:
+        periods = menstruation_data.get('data', {}).get('periods', [])
+        if periods:
+            m_df = pd.json_normalize(periods).rename(columns={
+                'start_time': 'date',
+                'flow': 'flow_intensity',  # 0-4 scale
+                'cycle_length_days': 'cycle_length',
+                'symptoms.cramps': 'symptoms_cramps',
+                'symptoms.mood_change': 'symptoms_mood'
+            })
+            m_df = m_df.reindex(columns=['date', 'cycle_day', 'flow_intensity',
+                                         'cycle_length', 'symptoms_cramps',
+                                         'symptoms_mood'])
+            m_df['flow_intensity'] = _normalize_flow_intensity(m_df['flow_intensity'])
+            for col in ('symptoms_cramps', 'symptoms_mood'):
+                m_df[col] = _normalize_symptom_severity(m_df[col])
+            m_df['period_active'] = True
+            frames.append(m_df)
+
+        # Process fertility/ovulation data
+        windows = fertility_data.get('data', {}).get('fertility_windows', [])
+        if windows:
+            raw = pd.json_normalize(windows).rename(columns={
+                'fertile': 'fertility_window',
+                'cervical_fluid_score': 'cervical_fluid',
+                'temperature': 'basal_temp'
+            })
+            # Ovulation flag: one bitwise OR over whichever boolean signals
+            # Terra included, instead of per-record branching
+            signal_cols = ['fertility_window', 'lh_surge',
+                           'basal_body_temp_rise', 'cervical_mucus_peak']
+            ovulation_flag = (
+                raw.reindex(columns=signal_cols, fill_value=False)
+                .fillna(False).astype(bool).any(axis=1).astype('int8')
+            )
+            f_df = raw.reindex(columns=['date', 'ovulation_probability',
+                                        'fertility_window', 'cervical_fluid',
+                                        'basal_temp'])
+            score_cols = ['ovulation_probability', 'cervical_fluid']
+            f_df[score_cols] = f_df[score_cols].fillna(0)
+            f_df['fertility_window'] = f_df['fertility_window'].fillna(False)
+            f_df['ovulation_flag'] = ovulation_flag
+            frames.append(f_df)
+
+        if not frames:
             return pd.DataFrame()
-            
-        df = pd.DataFrame(records)
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
-        
-        return df.dropna(subset=['date'])
+
+        # The frames share only the date key and have disjoint columns, so a
+        # single axis=1 alignment on a datetime64 index replaces outer merges
+        for i, frame in enumerate(frames):
+            # Explicit format + cache skips per-value format inference and
+            # dedupes repeated date strings through pandas' parse cache
+            frame['date'] = pd.to_datetime(
+                frame['date'].astype(str).str.slice(0, 10),
+                format='%Y-%m-%d', errors='coerce', cache=True
+            )
+            frame = frame.dropna(subset=['date']).set_index('date')
+            frames[i] = frame.loc[~frame.index.duplicated()]
+
+        df = pd.concat(frames, axis=1, join='outer').reset_index()
+        df['player_id'] = player_id
+        # Single-category codes give a fixed-width int8 column instead of one
+        # Python string object per row
+        df['data_type'] = pd.Categorical.from_codes(
+            np.zeros(len(df), dtype=np.int8), categories=['cycle_tracking']
+        )
+
+        # Apply the declared schema instead of trusting inference
+        schema = {k: v for k, v in CYCLE_SCHEMA.items() if k in df.columns}
+        df = df.astype(schema, copy=False, errors='ignore')
+
+        # Bounded scores fit in a byte (alignment may have upcast them) and
+        # low-cardinality strings compress to categories before storage
+        byte_cols = ['flow_intensity', 'ovulation_flag',
+                     'symptoms_cramps', 'symptoms_mood']
+        for col in byte_cols:
+            if col in df.columns and not df[col].isna().any():
+                df[col] = df[col].astype('int8')
+        for col in df.select_dtypes('object'):
+            if df[col].nunique() < 0.5 * len(df):
+                df[col] = df[col].astype('category')
+
+        return df
     
     def validate_data(self, df: pd.DataFrame) -> bool:
         """
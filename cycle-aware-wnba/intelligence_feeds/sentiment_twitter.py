@@ -9,6 +9,7 @@ Privacy Notice: Only public social media content is analyzed. No personal
 direct messages or private content is accessed.
 """
 
+import numpy as np
 import pandas as pd
 import requests
 from datetime import datetime, timedelta
@@ -71,7 +72,12 @@ class SentimentDataSource(DataSourceBase):
             'terrible', 'awful', 'horrible', 'disappointing', 'frustrated',
             'angry', 'upset', 'pathetic', 'useless', 'trash'
         ]
-        
+
+        # Precompiled whole-word alternations: keyword hits are counted in
+        # one C-level regex pass per polarity instead of per-tweet token loops
+        self._positive_re = re.compile(r'\b(?:%s)\b' % '|'.join(self.positive_keywords))
+        self._negative_re = re.compile(r'\b(?:%s)\b' % '|'.join(self.negative_keywords))
+
         # WNBA teams mapping for searches
         self.team_handles = {
             'ATL': 'atlhawks',  # Note: These would be actual WNBA team handles
@@ -295,51 +301,45 @@ class SentimentDataSource(DataSourceBase):
         return pd.concat([df, sentiment_df], axis=1)
     
     def _analyze_with_rule_based(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Analyze sentiment using rule-based approach with keyword matching."""
-        sentiment_results = []
-        
-        for content in df['content']:
-            content_lower = content.lower()
-            
-            # Clean content for analysis
-            content_clean = re.sub(r'[^\w\s]', ' ', content_lower)
-            words = content_clean.split()
-            
-            # Count positive and negative keywords
-            positive_count = sum(1 for word in words if word in self.positive_keywords)
-            negative_count = sum(1 for word in words if word in self.negative_keywords)
-            
-            # Simple scoring logic
-            if positive_count > negative_count:
-                sentiment_label = 'positive'
-                sentiment_score = min(0.5 + (positive_count * 0.1), 1.0)
-            elif negative_count > positive_count:
-                sentiment_label = 'negative' 
-                sentiment_score = max(0.5 - (negative_count * 0.1), 0.0)
-            else:
-                sentiment_label = 'neutral'
-                sentiment_score = 0.5
-            
-            # Additional heuristics
-            if '!' in content or content.isupper():
-                # Exclamation or all caps might indicate stronger sentiment
-                if sentiment_label == 'positive':
-                    sentiment_score = min(sentiment_score + 0.1, 1.0)
-                elif sentiment_label == 'negative':
-                    sentiment_score = max(sentiment_score - 0.1, 0.0)
-            
-            result = {
-                'sentiment_label': sentiment_label,
-                'sentiment_score': sentiment_score,
-                'positive_score': max(0, sentiment_score - 0.5) * 2 if sentiment_label == 'positive' else 0,
-                'negative_score': max(0, 0.5 - sentiment_score) * 2 if sentiment_label == 'negative' else 0,
-                'neutral_score': 1.0 if sentiment_label == 'neutral' else 0.2,
-                'keyword_positive_count': positive_count,
-                'keyword_negative_count': negative_count
-            }
-            sentiment_results.append(result)
-        
-        sentiment_df = pd.DataFrame(sentiment_results)
+        """Analyze sentiment using rule-based approach with keyword matching.
+
+        All scoring runs as whole-column operations: two regex count
+        passes for the keyword hits, then masked NumPy arithmetic for the
+        labels, scores and emphasis heuristics — no per-tweet Python loop
+        or per-row dict construction.
+        """
+        content = df['content'].astype(str)
+        lower = content.str.lower()
+
+        positive_count = lower.str.count(self._positive_re).to_numpy(np.int64)
+        negative_count = lower.str.count(self._negative_re).to_numpy(np.int64)
+
+        is_positive = positive_count > negative_count
+        is_negative = negative_count > positive_count
+
+        # Simple scoring logic, applied through masks
+        score = np.full(len(df), 0.5)
+        score[is_positive] = np.minimum(0.5 + positive_count[is_positive] * 0.1, 1.0)
+        score[is_negative] = np.maximum(0.5 - negative_count[is_negative] * 0.1, 0.0)
+
+        # Exclamation or all caps might indicate stronger sentiment
+        emphatic = (content.str.contains('!', regex=False)
+                    | content.str.isupper()).to_numpy()
+        score = np.where(is_positive & emphatic, np.minimum(score + 0.1, 1.0), score)
+        score = np.where(is_negative & emphatic, np.maximum(score - 0.1, 0.0), score)
+
+        label_codes = np.where(is_positive, 0, np.where(is_negative, 1, 2))
+        sentiment_df = pd.DataFrame({
+            'sentiment_label': pd.Categorical.from_codes(
+                label_codes, categories=['positive', 'negative', 'neutral']
+            ),
+            'sentiment_score': score,
+            'positive_score': np.where(is_positive, np.maximum(0, score - 0.5) * 2, 0.0),
+            'negative_score': np.where(is_negative, np.maximum(0, 0.5 - score) * 2, 0.0),
+            'neutral_score': np.where(is_positive | is_negative, 0.2, 1.0),
+            'keyword_positive_count': positive_count,
+            'keyword_negative_count': negative_count,
+        }, index=df.index)
         return pd.concat([df, sentiment_df], axis=1)
     
     def _add_sentiment_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -8,15 +8,48 @@ Weather factors considered: temperature, humidity, barometric pressure,
 precipitation, air quality, and seasonal patterns.
 """
 
+import asyncio
+from email.utils import parsedate_to_datetime
+
+import httpx
 import pandas as pd
-import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, Tuple
 import logging
 from .base import DataSourceBase
 
 logger = logging.getLogger(__name__)
 
+# Weather lookups are one small GET per (location, date); a modest pool
+# with keep-alive covers the whole fan-out on a handful of connections
+_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+_TRANSPORT_RETRIES = 3
+# Cap on simultaneous in-flight requests and the OpenWeatherMap free-tier
+# budget the pacer spreads them across
+_MAX_CONCURRENCY = 10
+_REQUESTS_PER_MINUTE = 60
+
+
+def _retry_after_seconds(response, default: float = 1.0) -> float:
+    """Parse a Retry-After header defensively.
+
+    The header may be delta-seconds or an HTTP-date (both RFC-allowed);
+    anything unparseable falls back to a fixed delay rather than raising.
+    """
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        delay = (parsedate_to_datetime(value)
+                 - datetime.now(timezone.utc)).total_seconds()
+        return max(delay, 0.0)
+    except (TypeError, ValueError):
+        return default
+
 
 class WeatherDataSource(DataSourceBase):
     """
@@ -86,38 +119,53 @@ class WeatherDataSource(DataSourceBase):
         locations = kwargs.get('locations', list(self.team_locations.keys()))
         weather_types = kwargs.get('weather_types', ['current', 'historical'])
         
-        all_data = []
-        
+        # Plan every (location, date) request up front, then run the whole
+        # fan-out concurrently: wall time collapses from the sum of
+        # round-trips to roughly the rate-limit floor, with a semaphore
+        # bounding in-flight requests and a pacer spreading them across
+        # the per-minute API budget
+        jobs = []
         for location in locations:
             if location not in self.team_locations:
                 logger.warning(f"Unknown location: {location}")
                 continue
-                
-            try:
-                location_data = self.team_locations[location]
-                
-                # Fetch different types of weather data
-                if 'current' in weather_types:
-                    current_data = self._fetch_current_weather(location_data)
-                    if current_data:
-                        all_data.extend(current_data)
-                
-                if 'historical' in weather_types:
-                    historical_data = self._fetch_historical_weather(
-                        location_data, start_date, end_date
-                    )
-                    all_data.extend(historical_data)
-                
-                # Add air quality data if available
-                if 'air_quality' in weather_types:
-                    air_quality_data = self._fetch_air_quality(location_data)
-                    if air_quality_data:
-                        all_data.extend(air_quality_data)
-                        
-            except Exception as e:
-                logger.error(f"Error fetching weather for {location}: {str(e)}")
+
+            location_data = self.team_locations[location]
+            if 'current' in weather_types:
+                jobs.append((('current', location_data, None),
+                             *self._current_request(location_data)))
+            if 'historical' in weather_types:
+                current_date = start_date
+                while current_date <= end_date:
+                    jobs.append((('historical', location_data, current_date),
+                                 *self._historical_request(location_data,
+                                                           current_date)))
+                    current_date += timedelta(days=1)
+            if 'air_quality' in weather_types:
+                jobs.append((('air_quality', location_data, None),
+                             *self._air_quality_request(location_data)))
+
+        if not jobs:
+            return pd.DataFrame()
+
+        payloads = asyncio.run(self._gather_weather(jobs))
+
+        all_data = []
+        for (data_type, location_data, date), payload in zip(
+                (job[0] for job in jobs), payloads):
+            if isinstance(payload, Exception):
+                logger.error(f"Error fetching {data_type} weather for "
+                             f"{location_data['city']}: {str(payload)}")
                 continue
-        
+            if data_type == 'current':
+                record = self._parse_current(location_data, payload)
+            elif data_type == 'historical':
+                record = self._parse_historical(location_data, date, payload)
+            else:
+                record = self._parse_air_quality(location_data, payload)
+            if record:
+                all_data.append(record)
+
         if not all_data:
             return pd.DataFrame()
             
@@ -128,8 +176,59 @@ class WeatherDataSource(DataSourceBase):
         
         return self.anonymize_data(combined_df)
     
-    def _fetch_current_weather(self, location_data: Dict) -> List[Dict]:
-        """Fetch current weather conditions for a location."""
+    async def _gather_weather(self, jobs: List[tuple]) -> list:
+        """Run every planned weather request concurrently over one client.
+
+        A semaphore caps in-flight requests and a shared pacer hands each
+        request the next slot in the per-minute budget, so the fan-out
+        saturates the documented rate limit without tripping it. A 429
+        still gets one Retry-After-honoring retry as a backstop.
+        """
+        sem = asyncio.Semaphore(_MAX_CONCURRENCY)
+        interval = 60.0 / _REQUESTS_PER_MINUTE
+        rate_lock = asyncio.Lock()
+        next_slot = 0.0
+
+        transport = httpx.AsyncHTTPTransport(
+            limits=_POOL_LIMITS, retries=_TRANSPORT_RETRIES
+        )
+        # Split timeout: a dead host fails the connect in 5 s instead of
+        # holding a pool slot for the full 30 s read budget
+        async with httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            headers={'Accept-Encoding': 'gzip'},
+        ) as client:
+
+            async def _pace():
+                nonlocal next_slot
+                async with rate_lock:
+                    now = asyncio.get_running_loop().time()
+                    wait = next_slot - now
+                    next_slot = max(now, next_slot) + interval
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            async def _one(endpoint, params):
+                async with sem:
+                    await _pace()
+                    response = await client.get(endpoint, params=params)
+                    if response.status_code == 429:
+                        await asyncio.sleep(_retry_after_seconds(response))
+                        # The retry takes its own pacer slot so the
+                        # backstop request stays inside the rate budget
+                        await _pace()
+                        response = await client.get(endpoint, params=params)
+                    response.raise_for_status()
+                    return response.json()
+
+            return await asyncio.gather(
+                *(_one(endpoint, params) for _meta, endpoint, params in jobs),
+                return_exceptions=True,
+            )
+
+    def _current_request(self, location_data: Dict) -> Tuple[str, Dict]:
+        """Build the (endpoint, params) pair for current conditions."""
         endpoint = f"{self.api_endpoint}/data/2.5/weather"
         params = {
             'lat': location_data['lat'],
@@ -137,12 +236,11 @@ class WeatherDataSource(DataSourceBase):
             'appid': self.api_key,
             'units': 'imperial'  # Fahrenheit for US cities
         }
-        
+        return endpoint, params
+
+    def _parse_current(self, location_data: Dict, data: Dict) -> Optional[Dict]:
+        """Parse a current-conditions payload into a standard record."""
         try:
-            response = requests.get(endpoint, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
             record = {
                 'location': location_data['city'],
                 'date': datetime.now().strftime('%Y-%m-%d'),
@@ -160,83 +258,64 @@ class WeatherDataSource(DataSourceBase):
                 'wind_direction_deg': data.get('wind', {}).get('deg', 0),
                 'precipitation_mm': data.get('rain', {}).get('1h', 0) + data.get('snow', {}).get('1h', 0)
             }
-            
-            return [record]
-            
+
+            return record
+
         except Exception as e:
-            logger.error(f"Error fetching current weather: {str(e)}")
-            return []
-    
-    def _fetch_historical_weather(self, location_data: Dict, start_date: datetime,
-                                 end_date: datetime) -> List[Dict]:
-        """Fetch historical weather data for a location and date range."""
-        records = []
-        
+            logger.error(f"Error parsing current weather: {str(e)}")
+            return None
+
+    def _historical_request(self, location_data: Dict,
+                            date: datetime) -> Tuple[str, Dict]:
+        """Build the (endpoint, params) pair for one historical day."""
         # OpenWeatherMap historical data requires timestamp
-        current_date = start_date
-        while current_date <= end_date:
-            timestamp = int(current_date.timestamp())
-            
-            endpoint = f"{self.api_endpoint}/data/2.5/onecall/timemachine"
-            params = {
-                'lat': location_data['lat'],
-                'lon': location_data['lon'],
-                'dt': timestamp,
-                'appid': self.api_key,
-                'units': 'imperial'
-            }
-            
-            try:
-                response = requests.get(endpoint, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                # Extract current day data
-                current_weather = data.get('current', {})
-                if current_weather:
-                    record = {
-                        'location': location_data['city'],
-                        'date': current_date.strftime('%Y-%m-%d'),
-                        'data_type': 'historical_weather',
-                        'temperature_f': current_weather.get('temp', 0),
-                        'feels_like_f': current_weather.get('feels_like', 0),
-                        'humidity_percent': current_weather.get('humidity', 0),
-                        'pressure_hpa': current_weather.get('pressure', 0),
-                        'uv_index': current_weather.get('uvi', 0),
-                        'weather_condition': current_weather.get('weather', [{}])[0].get('main', ''),
-                        'weather_description': current_weather.get('weather', [{}])[0].get('description', ''),
-                        'cloud_cover_percent': current_weather.get('clouds', 0),
-                        'wind_speed_mph': current_weather.get('wind_speed', 0),
-                        'wind_direction_deg': current_weather.get('wind_deg', 0),
-                        'precipitation_mm': current_weather.get('rain', {}).get('1h', 0)
-                    }
-                    records.append(record)
-                
-                # Rate limiting - OpenWeatherMap allows 60 calls/minute for free tier
-                import time
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error fetching historical weather for {current_date}: {str(e)}")
-            
-            current_date += timedelta(days=1)
-        
-        return records
-    
-    def _fetch_air_quality(self, location_data: Dict) -> List[Dict]:
-        """Fetch air quality data for a location."""
+        endpoint = f"{self.api_endpoint}/data/2.5/onecall/timemachine"
+        params = {
+            'lat': location_data['lat'],
+            'lon': location_data['lon'],
+            'dt': int(date.timestamp()),
+            'appid': self.api_key,
+            'units': 'imperial'
+        }
+        return endpoint, params
+
+    def _parse_historical(self, location_data: Dict, date: datetime,
+                          data: Dict) -> Optional[Dict]:
+        """Parse a historical-day payload into a standard record."""
+        current_weather = data.get('current', {})
+        if not current_weather:
+            return None
+        return {
+            'location': location_data['city'],
+            'date': date.strftime('%Y-%m-%d'),
+            'data_type': 'historical_weather',
+            'temperature_f': current_weather.get('temp', 0),
+            'feels_like_f': current_weather.get('feels_like', 0),
+            'humidity_percent': current_weather.get('humidity', 0),
+            'pressure_hpa': current_weather.get('pressure', 0),
+            'uv_index': current_weather.get('uvi', 0),
+            'weather_condition': current_weather.get('weather', [{}])[0].get('main', ''),
+            'weather_description': current_weather.get('weather', [{}])[0].get('description', ''),
+            'cloud_cover_percent': current_weather.get('clouds', 0),
+            'wind_speed_mph': current_weather.get('wind_speed', 0),
+            'wind_direction_deg': current_weather.get('wind_deg', 0),
+            'precipitation_mm': current_weather.get('rain', {}).get('1h', 0)
+        }
+
+    def _air_quality_request(self, location_data: Dict) -> Tuple[str, Dict]:
+        """Build the (endpoint, params) pair for air quality."""
         endpoint = f"{self.api_endpoint}/data/2.5/air_pollution"
         params = {
             'lat': location_data['lat'],
             'lon': location_data['lon'],
             'appid': self.api_key
         }
-        
+        return endpoint, params
+
+    def _parse_air_quality(self, location_data: Dict,
+                           data: Dict) -> Optional[Dict]:
+        """Parse an air-quality payload into a standard record."""
         try:
-            response = requests.get(endpoint, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
             air_quality = data.get('list', [{}])[0]
             main_aqi = air_quality.get('main', {})
             components = air_quality.get('components', {})
@@ -254,12 +333,12 @@ class WeatherDataSource(DataSourceBase):
                 'so2_concentration': components.get('so2', 0),
                 'nh3_concentration': components.get('nh3', 0)
             }
-            
-            return [record]
-            
+
+            return record
+
         except Exception as e:
-            logger.error(f"Error fetching air quality: {str(e)}")
-            return []
+            logger.error(f"Error parsing air quality: {str(e)}")
+            return None
     
     def _add_derived_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add derived weather features that may correlate with cycle symptoms."""
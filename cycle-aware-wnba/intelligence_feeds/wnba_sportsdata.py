@@ -8,15 +8,62 @@ Privacy Notice: Only publicly available performance statistics are used.
 No personal or medical information is accessed.
 """
 
+import asyncio
+import hashlib
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
+import httpx
 import requests
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
+import json
 import logging
 from .base import DataSourceBase
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by the concurrent season-endpoint fetches
+_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+_TRANSPORT_RETRIES = 3
+
+# Compiled once; strips punctuation from player names so lookups match
+# regardless of apostrophes or diacritic-adjacent characters
+_NAME_CLEAN_RE = re.compile(r'[^\w\s-]')
+
+# SportsData.io game-log fields -> our schema, applied as one vectorized
+# rename instead of per-row dict construction
+GAME_COLUMN_MAP = {
+    'GameID': 'game_id',
+    'Opponent': 'opponent_team',
+    'Minutes': 'minutes_played',
+    'Points': 'points',
+    'Rebounds': 'rebounds',
+    'Assists': 'assists',
+    'Steals': 'steals',
+    'BlockedShots': 'blocks',
+    'Turnovers': 'turnovers',
+    'FieldGoalPercentage': 'field_goal_percentage',
+    'ThreePointPercentage': 'three_point_percentage',
+    'FreeThrowPercentage': 'free_throw_percentage',
+    'PlusMinus': 'plus_minus',
+}
+GAME_NUMERIC_COLS = [
+    'minutes_played', 'points', 'rebounds', 'assists', 'steals', 'blocks',
+    'turnovers', 'field_goal_percentage', 'three_point_percentage',
+    'free_throw_percentage', 'plus_minus',
+]
+
 
 class WNBADataSource(DataSourceBase):
     """
@@ -52,10 +99,58 @@ class WNBADataSource(DataSourceBase):
         self.api_key = api_key
         self.api_endpoint = api_endpoint
         self.headers = {'Ocp-Apim-Subscription-Key': api_key}
-        
+
+        # Pooled keep-alive session for the synchronous lookup/schedule
+        # calls: reusing connections skips the TCP+TLS handshake per request
+        # and gzip halves the JSON bytes on the wire
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32, pool_maxsize=64,
+            max_retries=_TRANSPORT_RETRIES, pool_block=False,
+        )
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            **self.headers,
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+
         # Cache for team and player lookups
         self.teams_cache = {}
         self.players_cache = {}
+
+        # ETag revalidation cache: url -> (etag, decoded payload). Season
+        # payloads rarely change intraday, so a 304 costs zero bytes and
+        # skips the JSON parse entirely
+        self._etag_cache = {}
+
+        # On-disk response cache shared across processes; a one-day TTL
+        # keeps dev/test reruns off the network without staling live stats
+        self.cache_dir = Path('.cache/wnba')
+        self.cache_ttl = 86400
+
+    def _cache_path(self, endpoint: str) -> Path:
+        """Derive a stable cache file path for an endpoint URL."""
+        key = hashlib.sha256(endpoint.encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _cache_get(self, path: Path) -> Optional[list]:
+        """Return a cached payload if present and within TTL, else None."""
+        try:
+            if path.exists() and time.time() - path.stat().st_mtime < self.cache_ttl:
+                return _loads(path.read_bytes())
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _cache_put(self, path: Path, payload: list):
+        """Persist a payload to the on-disk cache (best effort)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(payload))
+        except OSError as e:
+            logger.warning(f"Could not write WNBA cache entry: {str(e)}")
     
     def fetch_data(self, player_ids: List[str], date_range: tuple, **kwargs) -> pd.DataFrame:
         """
@@ -76,10 +171,23 @@ class WNBADataSource(DataSourceBase):
         data_types = kwargs.get('data_types', ['games', 'stats', 'injuries'])
         
         all_data = []
-        
+
         # Ensure we have current team and player data
         self._refresh_lookup_data(season)
-        
+
+        # The SportsData.io stats endpoints are season-scoped, so one round
+        # trip per endpoint serves every requested player. Fetch them all
+        # concurrently instead of re-requesting the same payloads serially
+        # per player: wall time becomes ~one RTT rather than O(players).
+        payloads = self._fetch_season_payloads(season, data_types)
+
+        # Materialize each payload as a DataFrame exactly once; the per-player
+        # helpers then work from boolean masks on these shared frames instead
+        # of re-building the same season-wide frame per player
+        games_raw = pd.DataFrame(payloads.get('games', []))
+        stats_raw = pd.DataFrame(payloads.get('stats', []))
+        injuries_raw = pd.DataFrame(payloads.get('injuries', []))
+
         for player_id in player_ids:
             try:
                 # Convert player name to ID if needed
@@ -87,70 +195,161 @@ class WNBADataSource(DataSourceBase):
                 if not resolved_player_id:
                     logger.warning(f"Could not resolve player: {player_id}")
                     continue
-                
-                player_data = []
-                
-                # Fetch different data types
+
+                # Each helper returns a DataFrame directly; keeping the data
+                # columnar end-to-end avoids a records round-trip per player
+                player_frames = []
+
                 if 'games' in data_types:
-                    games_data = self._fetch_player_games(
-                        resolved_player_id, start_date, end_date, season
-                    )
-                    player_data.extend(games_data)
-                
+                    player_frames.append(self._fetch_player_games(
+                        resolved_player_id, start_date, end_date, games_raw
+                    ))
+
                 if 'stats' in data_types:
-                    stats_data = self._fetch_player_stats(
-                        resolved_player_id, start_date, end_date, season
-                    )
-                    player_data.extend(stats_data)
-                
+                    player_frames.append(self._fetch_player_stats(
+                        resolved_player_id, start_date, end_date, stats_raw
+                    ))
+
                 if 'injuries' in data_types:
-                    injury_data = self._fetch_injury_data(
-                        resolved_player_id, start_date, end_date, season
-                    )
-                    player_data.extend(injury_data)
-                
-                if player_data:
-                    player_df = pd.DataFrame(player_data)
+                    player_frames.append(self._fetch_injury_data(
+                        resolved_player_id, start_date, end_date, injuries_raw
+                    ))
+
+                player_frames = [f for f in player_frames if not f.empty]
+                if player_frames:
+                    player_df = pd.concat(player_frames, ignore_index=True)
                     player_df['original_player_id'] = player_id
                     player_df['resolved_player_id'] = resolved_player_id
                     all_data.append(player_df)
-                    
+
             except Exception as e:
                 logger.error(f"Error fetching WNBA data for {player_id}: {str(e)}")
                 continue
-        
+
         if not all_data:
             return pd.DataFrame()
-            
+
         combined_df = pd.concat(all_data, ignore_index=True)
+
+        # Compact dtypes before anonymization/storage: repeated tag columns
+        # become int8-coded categoricals and numeric stats are downcast
+        # (counts fit small ints, float32 is ample for percentages), which
+        # shrinks the frame several-fold for merges and Parquet alike
+        for col in ('data_type', 'opponent_team', 'home_away',
+                    'injury_status', 'injury_body_part'):
+            if col in combined_df.columns:
+                combined_df[col] = combined_df[col].astype('category')
+        for col in combined_df.select_dtypes(include='number').columns:
+            downcast = 'float' if combined_df[col].dtype.kind == 'f' else 'integer'
+            combined_df[col] = pd.to_numeric(combined_df[col], downcast=downcast)
+
         return self.anonymize_data(combined_df)
+
+    def _fetch_season_payloads(self, season: str, data_types: List[str]) -> Dict[str, list]:
+        """Fetch all requested season-level endpoints in one concurrent pass."""
+        endpoints = {}
+        if 'games' in data_types:
+            endpoints['games'] = f"{self.api_endpoint}/stats/json/PlayerGameStatsBySeason/{season}"
+        if 'stats' in data_types:
+            endpoints['stats'] = f"{self.api_endpoint}/stats/json/PlayerSeasonStats/{season}"
+        if 'injuries' in data_types:
+            endpoints['injuries'] = f"{self.api_endpoint}/scores/json/Injuries/{season}"
+        if not endpoints:
+            return {}
+
+        keys = list(endpoints)
+        results = asyncio.run(self._gather_endpoints([endpoints[k] for k in keys]))
+
+        payloads = {}
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching {key} for season {season}: {str(result)}")
+                payloads[key] = []
+            else:
+                payloads[key] = result
+        return payloads
+
+    async def _gather_endpoints(self, endpoints: List[str]) -> list:
+        """Issue all endpoint GETs over one pooled keep-alive client."""
+        transport = httpx.AsyncHTTPTransport(
+            limits=_POOL_LIMITS, retries=_TRANSPORT_RETRIES
+        )
+        async with httpx.AsyncClient(
+            transport=transport, headers=self.headers, timeout=30.0
+        ) as client:
+            return await asyncio.gather(
+                *(self._afetch_json(client, e) for e in endpoints),
+                return_exceptions=True,
+            )
+
+    async def _afetch_json(self, client: httpx.AsyncClient, endpoint: str) -> list:
+        disk_path = self._cache_path(endpoint)
+        disk_cached = self._cache_get(disk_path)
+        if disk_cached is not None:
+            return disk_cached
+
+        cached = self._etag_cache.get(endpoint)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        response = await client.get(endpoint, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        response.raise_for_status()
+        payload = _loads(response.content)
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache[endpoint] = (etag, payload)
+        if payload:
+            self._cache_put(disk_path, payload)
+        return payload
     
+    def _get_json(self, endpoint: str) -> list:
+        """Blocking GET + decode with disk cache and ETag revalidation."""
+        disk_path = self._cache_path(endpoint)
+        disk_cached = self._cache_get(disk_path)
+        if disk_cached is not None:
+            return disk_cached
+
+        cached = self._etag_cache.get(endpoint)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        response = self.session.get(endpoint, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        response.raise_for_status()
+        payload = _loads(response.content)
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache[endpoint] = (etag, payload)
+        if payload:
+            self._cache_put(disk_path, payload)
+        return payload
+
     def _refresh_lookup_data(self, season: str):
         """Refresh cached team and player lookup data."""
         try:
-            # Fetch teams
+            # The two lookup endpoints are independent, so overlap their
+            # round trips; requests releases the GIL while waiting on I/O
             teams_endpoint = f"{self.api_endpoint}/scores/json/teams"
-            teams_response = requests.get(teams_endpoint, headers=self.headers)
-            teams_response.raise_for_status()
-            
-            teams_data = teams_response.json()
-            self.teams_cache = {team['Key']: team for team in teams_data}
-            
-            # Fetch players for the season
             players_endpoint = f"{self.api_endpoint}/scores/json/Players/{season}"
-            players_response = requests.get(players_endpoint, headers=self.headers)
-            players_response.raise_for_status()
-            
-            players_data = players_response.json()
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                teams_future = ex.submit(self._get_json, teams_endpoint)
+                players_future = ex.submit(self._get_json, players_endpoint)
+                teams_data = teams_future.result()
+                players_data = players_future.result()
+
+            self.teams_cache = {team['Key']: team for team in teams_data}
             self.players_cache = {
                 player['PlayerID']: player for player in players_data
             }
             
-            # Also create name-to-ID mapping
-            self.player_name_map = {
-                f"{player['FirstName']} {player['LastName']}".lower(): player['PlayerID']
-                for player in players_data
-            }
+            # Also create name-to-ID mapping, cleaning names in one
+            # vectorized string pass instead of per-player formatting
+            players_df = pd.DataFrame(players_data)
+            names = (
+                players_df['FirstName'].str.cat(players_df['LastName'], sep=' ')
+                .str.replace(_NAME_CLEAN_RE, '', regex=True)
+                .str.lower().str.strip()
+            )
+            self.player_name_map = dict(zip(names, players_df['PlayerID']))
             
         except Exception as e:
             logger.error(f"Error refreshing lookup data: {str(e)}")
@@ -165,8 +364,8 @@ class WNBADataSource(DataSourceBase):
         except ValueError:
             pass
         
-        # Try to find by name
-        normalized_name = player_identifier.lower().strip()
+        # Try to find by name, normalized the same way as the lookup keys
+        normalized_name = _NAME_CLEAN_RE.sub('', player_identifier).lower().strip()
         if normalized_name in self.player_name_map:
             return self.player_name_map[normalized_name]
         
@@ -178,72 +377,55 @@ class WNBADataSource(DataSourceBase):
         return None
     
     def _fetch_player_games(self, player_id: int, start_date: datetime,
-                           end_date: datetime, season: str) -> List[Dict]:
-        """Fetch game logs for a specific player."""
-        endpoint = f"{self.api_endpoint}/stats/json/PlayerGameStatsBySeason/{season}"
-        
+                           end_date: datetime, all_games: pd.DataFrame) -> pd.DataFrame:
+        """Extract game logs for a specific player from the season payload."""
         try:
-            response = requests.get(endpoint, headers=self.headers)
-            response.raise_for_status()
-            all_games = response.json()
-            
-            # Filter for this player and date range
-            player_games = [
-                game for game in all_games 
-                if game['PlayerID'] == player_id
-            ]
-            
-            records = []
-            for game in player_games:
-                game_date = datetime.strptime(game['Day'], '%Y-%m-%dT%H:%M:%S')
-                
-                if start_date <= game_date <= end_date:
-                    record = {
-                        'player_id': str(player_id),
-                        'date': game_date.strftime('%Y-%m-%d'),
-                        'data_type': 'game_performance',
-                        'game_id': game.get('GameID'),
-                        'opponent_team': game.get('Opponent'),
-                        'home_away': 'home' if game.get('HomeOrAway') == 'HOME' else 'away',
-                        'minutes_played': game.get('Minutes', 0),
-                        'points': game.get('Points', 0),
-                        'rebounds': game.get('Rebounds', 0),
-                        'assists': game.get('Assists', 0),
-                        'steals': game.get('Steals', 0),
-                        'blocks': game.get('BlockedShots', 0),
-                        'turnovers': game.get('Turnovers', 0),
-                        'field_goal_percentage': game.get('FieldGoalPercentage', 0),
-                        'three_point_percentage': game.get('ThreePointPercentage', 0),
-                        'free_throw_percentage': game.get('FreeThrowPercentage', 0),
-                        'plus_minus': game.get('PlusMinus', 0),
-                        'team_won': game.get('IsGameOver') and game.get('FantasyPoints', 0) > 0
-                    }
-                    records.append(record)
-            
-            return records
-            
+            raw = all_games
+            if raw.empty or 'PlayerID' not in raw.columns:
+                return pd.DataFrame()
+
+            # One vectorized pass replaces the per-game dict/strptime loop:
+            # filtering, renaming and derived columns all run at C level
+            raw = raw[raw['PlayerID'] == player_id]
+            dates = pd.to_datetime(
+                raw['Day'], format='%Y-%m-%dT%H:%M:%S', errors='coerce'
+            )
+            raw = raw[(dates >= start_date) & (dates <= end_date)]
+            if raw.empty:
+                return pd.DataFrame()
+
+            df = (
+                raw.reindex(columns=list(GAME_COLUMN_MAP))
+                .rename(columns=GAME_COLUMN_MAP)
+            )
+            df[GAME_NUMERIC_COLS] = df[GAME_NUMERIC_COLS].fillna(0)
+            df['player_id'] = str(player_id)
+            df['date'] = dates.loc[raw.index].dt.strftime('%Y-%m-%d')
+            df['data_type'] = 'game_performance'
+            df['home_away'] = np.where(
+                raw['HomeOrAway'] == 'HOME', 'home', 'away'
+            ) if 'HomeOrAway' in raw.columns else 'away'
+            df['team_won'] = (
+                raw.reindex(columns=['IsGameOver'], fill_value=False)['IsGameOver'].fillna(False).astype(bool)
+                & (raw.reindex(columns=['FantasyPoints'], fill_value=0)['FantasyPoints'].fillna(0) > 0)
+            )
+            return df
+
         except Exception as e:
             logger.error(f"Error fetching games for player {player_id}: {str(e)}")
-            return []
+            return pd.DataFrame()
     
     def _fetch_player_stats(self, player_id: int, start_date: datetime,
-                           end_date: datetime, season: str) -> List[Dict]:
-        """Fetch aggregate statistics for a player."""
-        endpoint = f"{self.api_endpoint}/stats/json/PlayerSeasonStats/{season}"
-        
+                           end_date: datetime, all_stats: pd.DataFrame) -> pd.DataFrame:
+        """Extract aggregate statistics for a player from the season payload."""
         try:
-            response = requests.get(endpoint, headers=self.headers)
-            response.raise_for_status()
-            all_stats = response.json()
-            
             # Find this player's season stats
-            player_stats = next(
-                (stats for stats in all_stats if stats['PlayerID'] == player_id),
-                None
-            )
-            
-            if not player_stats:
-                return []
+            if all_stats.empty or 'PlayerID' not in all_stats.columns:
+                return pd.DataFrame()
+            rows = all_stats[all_stats['PlayerID'] == player_id]
+            if rows.empty:
+                return pd.DataFrame()
+            player_stats = rows.iloc[0].to_dict()
             
             # Create aggregated record for the season
             record = {
@@ -265,57 +447,48 @@ class WNBADataSource(DataSourceBase):
                 'player_efficiency_rating': player_stats.get('PlayerEfficiencyRating', 0)
             }
             
-            return [record]
-            
+            return pd.DataFrame([record])
+
         except Exception as e:
             logger.error(f"Error fetching stats for player {player_id}: {str(e)}")
-            return []
+            return pd.DataFrame()
     
     def _fetch_injury_data(self, player_id: int, start_date: datetime,
-                          end_date: datetime, season: str) -> List[Dict]:
-        """Fetch injury report data for a player."""
-        endpoint = f"{self.api_endpoint}/scores/json/Injuries/{season}"
-        
+                          end_date: datetime, all_injuries: pd.DataFrame) -> pd.DataFrame:
+        """Extract injury report data for a player from the season payload."""
         try:
-            response = requests.get(endpoint, headers=self.headers)
-            response.raise_for_status()
-            all_injuries = response.json()
-            
-            # Filter for this player
-            player_injuries = [
-                injury for injury in all_injuries 
-                if injury.get('PlayerID') == player_id
-            ]
-            
-            records = []
-            for injury in player_injuries:
-                injury_date_str = injury.get('Updated')
-                if injury_date_str:
-                    try:
-                        injury_date = datetime.strptime(
-                            injury_date_str.split('T')[0], '%Y-%m-%d'
-                        )
-                        
-                        if start_date <= injury_date <= end_date:
-                            record = {
-                                'player_id': str(player_id),
-                                'date': injury_date.strftime('%Y-%m-%d'),
-                                'data_type': 'injury_report',
-                                'injury_status': injury.get('Status'),
-                                'injury_body_part': injury.get('BodyPart'),
-                                'injury_details': injury.get('InjuryDetail'),
-                                'expected_return': injury.get('ExpectedReturn'),
-                                'games_missed': 0  # Would need additional logic to calculate
-                            }
-                            records.append(record)
-                    except ValueError:
-                        continue
-            
-            return records
-            
+            raw = all_injuries
+            if raw.empty or 'PlayerID' not in raw.columns:
+                return pd.DataFrame()
+
+            # Vectorized filter + date parse; invalid or missing Updated
+            # stamps coerce to NaT and drop out with the range mask
+            raw = raw[raw['PlayerID'] == player_id]
+            dates = pd.to_datetime(
+                raw.get('Updated', pd.Series(dtype=object)).str.slice(0, 10),
+                format='%Y-%m-%d', errors='coerce'
+            )
+            raw = raw[(dates >= start_date) & (dates <= end_date)]
+            if raw.empty:
+                return pd.DataFrame()
+
+            df = raw.reindex(columns=[
+                'Status', 'BodyPart', 'InjuryDetail', 'ExpectedReturn',
+            ]).rename(columns={
+                'Status': 'injury_status',
+                'BodyPart': 'injury_body_part',
+                'InjuryDetail': 'injury_details',
+                'ExpectedReturn': 'expected_return',
+            })
+            df['player_id'] = str(player_id)
+            df['date'] = dates.loc[raw.index].dt.strftime('%Y-%m-%d')
+            df['data_type'] = 'injury_report'
+            df['games_missed'] = 0  # Would need additional logic to calculate
+            return df
+
         except Exception as e:
             logger.error(f"Error fetching injuries for player {player_id}: {str(e)}")
-            return []
+            return pd.DataFrame()
     
     def get_team_schedule(self, season: str, team_key: str = None) -> pd.DataFrame:
         """
@@ -331,30 +504,28 @@ class WNBADataSource(DataSourceBase):
         endpoint = f"{self.api_endpoint}/scores/json/Games/{season}"
         
         try:
-            response = requests.get(endpoint, headers=self.headers)
-            response.raise_for_status()
-            games = response.json()
-            
+            games = self._get_json(endpoint)
+
+            # Build the frame once and filter/rename vectorized rather than
+            # looping game dicts in Python
+            df = pd.DataFrame(games).reindex(columns=[
+                'GameID', 'Day', 'HomeTeam', 'AwayTeam',
+                'SeasonType', 'Week', 'Status',
+            ]).rename(columns={
+                'GameID': 'game_id',
+                'Day': 'date',
+                'HomeTeam': 'home_team',
+                'AwayTeam': 'away_team',
+                'SeasonType': 'season_type',
+                'Week': 'week',
+                'Status': 'status',
+            })
+
             if team_key:
-                games = [
-                    game for game in games 
-                    if game.get('HomeTeam') == team_key or game.get('AwayTeam') == team_key
-                ]
-            
-            schedule_records = []
-            for game in games:
-                record = {
-                    'game_id': game.get('GameID'),
-                    'date': game.get('Day', '').split('T')[0],
-                    'home_team': game.get('HomeTeam'),
-                    'away_team': game.get('AwayTeam'),
-                    'season_type': game.get('SeasonType'),
-                    'week': game.get('Week'),
-                    'status': game.get('Status')
-                }
-                schedule_records.append(record)
-            
-            return pd.DataFrame(schedule_records)
+                df = df[(df['home_team'] == team_key) | (df['away_team'] == team_key)]
+
+            df['date'] = df['date'].fillna('').str.split('T').str[0]
+            return df.reset_index(drop=True)
             
         except Exception as e:
             logger.error(f"Error fetching schedule: {str(e)}")
@@ -391,10 +562,12 @@ class WNBADataSource(DataSourceBase):
             if not invalid_minutes.empty:
                 logger.warning(f"Potentially invalid minutes: {len(invalid_minutes)} records")
         
-        # Check date validity
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
-        future_dates = df[df['date'] > datetime.now()]
-        if not future_dates.empty:
-            logger.warning(f"Found {len(future_dates)} records with future dates")
+        # Check date validity in one mixed-format C parse, without mutating
+        # the caller's frame; unparseable values coerce to NaT and are
+        # excluded from the future-date comparison
+        dates = pd.to_datetime(df['date'], format='mixed', errors='coerce')
+        future_count = int((dates > datetime.now()).sum())
+        if future_count:
+            logger.warning(f"Found {future_count} records with future dates")
         
         return True
\ No newline at end of file